@@ -1,76 +1,160 @@
+import contextlib
+import importlib.util
+import os
+import uuid
 import warnings
-from collections.abc import Sequence
+from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from rdata import read_rda
-from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry import MultiPolygon
 
+from ggseg_py.__version__ import __version__
+from ggseg_py.conversion_dicts import aseg_dict
 
-def _list_to_multipolygon(coords: list[Sequence[Sequence[float]]]) -> MultiPolygon:
+# pyarrow is optional for geopandas, fall back to python-backed strings without it
+_STRING_DTYPE = pd.StringDtype('pyarrow' if importlib.util.find_spec('pyarrow') else 'python')
+
+# Bump whenever the parsed atlas frame changes, so caches written by older code are not reused
+_CACHE_FORMAT = 1
+
+# StructName -> roi conversion dictionaries per supported atlas
+_ATLAS_MAPS: dict[str, dict] = {'aseg': aseg_dict}
+
+
+def _build_geometries(series: pd.Series) -> np.ndarray:
     """
-    Convert a nested list of rings into a MultiPolygon.
+    Convert a column of nested ring lists into MultiPolygons in a single batch.
+
+    All rings of all rows are flattened into one coordinate array so that the
+    geometries can be created with the vectorized shapely constructors instead
+    of one `Polygon` call per polygon.
 
     Parameters
     ----------
-    coords : sequence of polygons
-        Each polygon is a sequence of rings, and each ring is a sequence of [x, y] floats.
+    series : Series
+        Each element is a sequence of polygons, each polygon a sequence of rings,
+        and each ring a sequence of [x, y] floats.
 
     Returns
     -------
-    MultiPolygon
-        Combined geometry of all polygons.
+    ndarray
+        Object array with one MultiPolygon per element of `series`.
     """
-    polys: list[Polygon] = []
-    for polygon in coords:
-        if not polygon:
-            continue
-        exterior = polygon[0]
-        interiors = polygon[1:] if len(polygon) > 1 else []
-        polys.append(Polygon(shell=exterior, holes=interiors))
-    return MultiPolygon(polys)
+    rings: list[np.ndarray] = []
+    ring_to_poly: list[int] = []
+    poly_to_row: list[int] = []
+    for row, polygons in enumerate(series):
+        for polygon in polygons:
+            if not polygon:
+                continue
+            for ring in polygon:
+                rings.append(np.asarray(ring, dtype=np.float64))
+                ring_to_poly.append(len(poly_to_row))
+            poly_to_row.append(row)
+
+    multis = np.empty(len(series), dtype=object)
+    if rings:
+        coords = np.concatenate(rings)
+        coord_to_ring = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+        linearrings = shapely.linearrings(coords, indices=coord_to_ring)
+        polys = shapely.polygons(linearrings, indices=ring_to_poly)
+        shapely.multipolygons(polys, indices=poly_to_row, out=multis)
+
+    # rows without any polygon stay empty, as with the MultiPolygon constructor
+    for row in np.flatnonzero(shapely.is_missing(multis)):
+        multis[row] = MultiPolygon()
+    return multis
+
+
+def _use_string_dtype(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """
+    Store all string columns with the storage of `_STRING_DTYPE`.
 
+    Parameters
+    ----------
+    gdf : GeoDataFrame
+        Parsed or cached atlas.
 
-def rda2gpd(path2atlas: str, atlas_name: str) -> gpd.GeoDataFrame:
+    Returns
+    -------
+    GeoDataFrame
+        The atlas with every `pd.StringDtype` column cast to `_STRING_DTYPE`.
+    """
+    strings = [col for col, dtype in gdf.dtypes.items() if isinstance(dtype, pd.StringDtype)]
+    return gdf.astype(dict.fromkeys(strings, _STRING_DTYPE)) if strings else gdf
+
+
+def rda2gpd(path2atlas: str | Path, atlas_name: str, use_cache: bool = True) -> gpd.GeoDataFrame:
     """
     Load atlas data from an R .rda file and convert to GeoDataFrame.
 
+    The parsed atlas is cached as a GeoParquet file next to the .rda file
+    (``<atlas>.<atlas_name>.<version>.c<format>.parquet``) and reused as long as it
+    is newer than the .rda file. The package version and cache format in the name
+    keep caches from older parsing code from being reused. Caching requires pyarrow
+    and is skipped silently if it is missing or the directory is not writable; a
+    cache that cannot be read is ignored and the .rda file is parsed again.
+
     Parameters
     ----------
-    path2atlas : str
+    path2atlas : str or Path
         Filepath to the .rda atlas file.
     atlas_name : str
         Name of the object inside the .rda to extract (e.g., 'aseg').
+    use_cache : bool, default True
+        If True, read from and write to the GeoParquet cache.
 
     Returns
     -------
     GeoDataFrame
         A GeoDataFrame with 'geometry', 'region', 'label', and optional 'roi' columns.
     """
+    path2atlas = Path(path2atlas)
+    cache_path = path2atlas.with_name(f'{path2atlas.stem}.{atlas_name}.{__version__}.c{_CACHE_FORMAT}.parquet')
+    if use_cache and cache_path.exists() and cache_path.stat().st_mtime > path2atlas.stat().st_mtime:
+        # e.g. pyarrow missing, a corrupt file or one written by another user without read access
+        with contextlib.suppress(ImportError, OSError, ValueError):
+            # Parquet does not record the string storage, restore the one a fresh parse uses
+            return _use_string_dtype(gpd.read_parquet(cache_path))
+
     with warnings.catch_warnings():
         warnings.simplefilter('ignore')  # ignoring because fixing issues below
         atlas_r: dict = read_rda(path2atlas)
     df: pd.DataFrame = atlas_r[atlas_name]['data']  # type: ignore
 
-    # Convert nested lists to MultiPolygon
-    df['geometry'] = df['geometry'].apply(_list_to_multipolygon)
+    # Convert nested lists to MultiPolygon, stored directly as a GeometryArray
+    df['geometry'] = gpd.array.from_shapely(_build_geometries(df['geometry']))
 
     # Clean up region and label fields
-    regions: list[str] = []
-    labels: list[str] = []
-    for region, label in zip(df['region'], df['label']):
-        regions.append(region if region is not None else '???')
-        labels.append(label if label is not None else '???')
-    df['region'] = regions
-    df['label'] = labels
+    names = df[['region', 'label']]
+    df[['region', 'label']] = names.where(names.notna(), '???')
 
     # Add 'roi' column for aseg atlas
     if atlas_name == 'aseg':
-        df['roi'] = df['hemi'] + '_' + df['label']  # type: ignore
+        df['hemi'] = df['hemi'].astype(_STRING_DTYPE)
+        df['label'] = df['label'].astype(_STRING_DTYPE)
+        df['roi'] = df['hemi'].str.cat(df['label'], sep='_')
     elif atlas_name == 'glasser':
         df['roi'] = [label.split('_')[1] + '_' + label.split('_')[-1] + '_ROI' for label in df['label']]
 
-    return gpd.GeoDataFrame(df, geometry='geometry')
+    gdf = _use_string_dtype(gpd.GeoDataFrame(df, geometry='geometry'))
+    if use_cache:
+        # Write to a temporary file and move it into place, so concurrent readers
+        # (e.g. parallel test workers) never see a partially written cache
+        with contextlib.suppress(ImportError, OSError):
+            # Unique name, created with mode 0666 so the umask applies like for any new file
+            tmp_path = cache_path.with_name(f'.{cache_path.name}.{uuid.uuid4().hex}.tmp')
+            os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+            try:
+                gdf.to_parquet(tmp_path, compression='zstd')
+                tmp_path.replace(cache_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+    return gdf
 
 
 def merge_data(data: pd.DataFrame, geo_df: gpd.GeoDataFrame, atlas_name: str) -> gpd.GeoDataFrame:
@@ -80,26 +164,44 @@ def merge_data(data: pd.DataFrame, geo_df: gpd.GeoDataFrame, atlas_name: str) ->
     Parameters
     ----------
     data : DataFrame
-        Table containing a 'StructName' column mapping to atlas ROIs.
+        Table containing a 'StructName' column mapping to atlas ROIs, with at most one row per ROI.
     geo_df : GeoDataFrame
         GeoDataFrame produced by `rda2gpd`, including 'roi' column.
     atlas_name : str
-        One of ['aseg', 'glasser', 'dk'], selects appropriate mapping dict.
+        Selects the appropriate mapping dict; currently only 'aseg' is supported.
 
     Returns
     -------
     GeoDataFrame
-        Merged geospatial dataframe with measurements joined on 'roi'.
+        Merged geospatial dataframe with measurements joined on 'roi' (outer join).
+        Rows are grouped by ROI in order of first appearance in `geo_df`, followed by
+        ROIs that only occur in `data`; polygons are drawn in this order.
     """
-    # Dynamically import the correct conversion dictionary
-    if atlas_name == 'aseg':
-        from ggseg_py.conversion_dicts import aseg_dict as mapping
-
-        # Create ROI column in data
-        data = data.copy()
-        data['roi'] = data['StructName'].replace(mapping)  # type: ignore
-    else:
-        raise ValueError(f'Unsupported atlas_name: {atlas_name}')
-
-    # Merge and return
-    return geo_df.merge(data, on='roi', how='outer')
+    try:
+        mapping = _ATLAS_MAPS[atlas_name]
+    except KeyError:
+        raise ValueError(f'Unsupported atlas_name: {atlas_name}') from None
+
+    # Create ROI column in data
+    data = data.assign(roi=data['StructName'].map(mapping).fillna(data['StructName']))
+
+    # Join on categorical codes over a shared set of categories
+    original_dtype = geo_df['roi'].dtype
+    atlas_rois = pd.Index(geo_df['roi'].dropna().unique())
+    data_rois = pd.Index(data['roi'].dropna().unique())
+    roi_dtype = pd.CategoricalDtype([*atlas_rois, *data_rois[~data_rois.isin(atlas_rois)]])
+    geo_df = geo_df.assign(roi=geo_df['roi'].astype(roi_dtype))
+    data = data.assign(roi=data['roi'].astype(roi_dtype))
+
+    # Join on the roi index; suffixes and column order match a merge on 'roi'
+    merged = (
+        geo_df.set_index('roi')
+        .join(data.set_index('roi'), how='outer', lsuffix='_x', rsuffix='_y', validate='m:1')
+        .reset_index()
+    )
+    columns = list(merged.columns[1:])
+    columns.insert(geo_df.columns.get_loc('roi'), 'roi')
+    merged = merged[columns]
+    # The categorical only serves the join, hand back the atlas' own roi dtype
+    merged['roi'] = merged['roi'].astype(original_dtype)
+    return merged
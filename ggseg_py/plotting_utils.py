@@ -5,9 +5,18 @@ import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import shapely
 from matplotlib import cm
+from matplotlib.collections import PathCollection
 from matplotlib.colors import TwoSlopeNorm
 from matplotlib.patches import Patch
+from matplotlib.path import Path
+
+# Attribute set on the colorbar axes or legend drawn for caller-provided axes. It holds the
+# decoration and the positions of the axes it belongs to before it was added, so plotting into
+# any of these axes again can remove it and hand a colorbar's space back. Keeping this state on
+# the figure's own artists lets it be collected together with the figure.
+_REUSE_TAG = '_ggseg_py_reuse'
 
 
 def _prepare_coloring(
@@ -43,23 +52,26 @@ def _prepare_coloring(
     """
     if isinstance(cmap, str):
         cmap = plt.get_cmap(cmap)
-    vals = data.dropna()
-    is_numeric = pd.api.types.is_numeric_dtype(vals)
+    is_numeric = pd.api.types.is_numeric_dtype(data)
     norm: mcolors.Normalize | None = None
     color_map: dict | None = None
     if is_numeric:
-        low = vmin if vmin is not None else vals.min()
-        high = vmax if vmax is not None else vals.max()
+        arr = data.to_numpy(dtype=float, na_value=np.nan)
+        # like Series.min/max, an all-missing column gives NaN limits without warning
+        empty = np.isnan(arr).all()
+        low = vmin if vmin is not None else np.nan if empty else np.nanmin(arr)
+        high = vmax if vmax is not None else np.nan if empty else np.nanmax(arr)
         if low < 0 < high:
             lim = max(abs(low), abs(high))
             norm = TwoSlopeNorm(vmin=-lim, vcenter=0, vmax=lim)
         else:
             norm = mcolors.Normalize(vmin=low, vmax=high)
     else:
-        cats = pd.Categorical(vals).categories
+        # categories never include missing values
+        cats = pd.Categorical(data).categories
         n = len(cats)
-        colors = [cmap(i / max(n - 1, 1)) for i in range(n)]
-        color_map = dict(zip(cats, colors))
+        rgba = cmap(np.arange(n) / max(n - 1, 1))
+        color_map = dict(zip(cats, map(tuple, rgba)))
     return is_numeric, norm, color_map, cmap
 
 
@@ -70,7 +82,7 @@ def _add_colorbar(
     cmap: mcolors.Colormap,
     norm: mcolors.Normalize | None = None,
     color_map: dict | None = None,
-) -> None:
+) -> Any:
     """
     Attach a colorbar or categorical legend to the figure.
 
@@ -88,28 +100,167 @@ def _add_colorbar(
         Normalize instance for numeric data; if provided, a colorbar is created.
     color_map : dict, optional
         Category-to-color mapping for categorical data; if provided, a legend is created.
+
+    Returns
+    -------
+    Colorbar, Legend or None
+        The added colorbar or legend.
     """
     if color_map is not None:
         patches = [Patch(facecolor=color_map[cat], edgecolor='black', label=str(cat)) for cat in color_map]
-        fig.legend(handles=patches, title=label, loc='center left', bbox_to_anchor=(1.02, 0.5))
-    elif norm is not None:
+        return fig.legend(handles=patches, title=label, loc='center left', bbox_to_anchor=(1.02, 0.5))
+    if norm is not None:
         mappable = cm.ScalarMappable(norm=norm, cmap=cmap)
         cbar = fig.colorbar(mappable, ax=axes, orientation='vertical', fraction=0.05, pad=0.02)
         cbar.set_label(label)
+        return cbar
+    return None
+
+
+def _reset_axes(fig: plt.Figure, axes: np.ndarray) -> None:
+    """
+    Clear reused axes and remove the colorbar or legend of earlier plots into them.
+
+    A colorbar or legend is removed if it belongs to any of `axes`; every axes it
+    belongs to gets back the position it had before the colorbar was added.
+
+    Parameters
+    ----------
+    fig : Figure
+        Figure holding the colorbars and legends.
+    axes : array of Axes
+        Axes about to be drawn into again.
+    """
+    reused = set(axes.flat)
+    for artist in [*fig.axes, *fig.legends]:
+        tag = getattr(artist, _REUSE_TAG, None)
+        if tag is None:
+            continue
+        decoration, positions = tag
+        if reused.isdisjoint(ax for ax, _ in positions):
+            continue
+        decoration.remove()
+        for ax, position in positions:
+            ax.set_position(position)
+    for ax in axes.flat:
+        ax.clear()
+
+
+def _geometry_paths(geoms: np.ndarray) -> list[Path]:
+    """
+    Build one compound path per geometry from its ragged coordinate arrays.
+
+    All coordinates are converted in a single `shapely.to_ragged_array` call; every
+    ring becomes a closed sub-path of the path of the geometry it belongs to, so holes
+    and the parts of MultiPolygons are drawn like geopandas does.
+
+    Parameters
+    ----------
+    geoms : array-like of geometries
+        Polygons or MultiPolygons to convert.
+
+    Returns
+    -------
+    list of Path
+        One path per geometry, in the order of `geoms`.
+    """
+    if not len(geoms):
+        return []
+    _, coords, offsets = shapely.to_ragged_array(geoms, include_z=False)
+
+    # offsets are (ring, [part,] geometry); resolve geometry bounds to coordinate positions
+    ring_offsets = offsets[0]
+    geom_offsets = offsets[-1]
+    for nested in offsets[-2::-1]:
+        geom_offsets = nested[geom_offsets]
+
+    codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+    codes[ring_offsets[:-1]] = Path.MOVETO
+    codes[ring_offsets[1:] - 1] = Path.CLOSEPOLY
+
+    bounds = geom_offsets[1:-1]
+    return [Path(v, c) for v, c in zip(np.split(coords, bounds), np.split(codes, bounds))]
+
+
+def _view_to_collection(paths: list[Path], colors: Any, edgecolor: str, linewidth: float) -> PathCollection:
+    """
+    Build a single collection from precomputed geometry paths.
+
+    Parameters
+    ----------
+    paths : list of Path
+        One compound path per geometry, see `_geometry_paths`.
+    colors : color, array of colors or None
+        Face color for all geometries or one RGBA row per geometry; None leaves the
+        face colors to be mapped from data with `set_array`.
+    edgecolor : str
+        Color for polygon edges.
+    linewidth : float
+        Width of polygon edges.
+
+    Returns
+    -------
+    PathCollection
+        Collection ready to be added to an Axes.
+    """
+    return PathCollection(paths, facecolors=colors, edgecolors=edgecolor, linewidths=linewidth)
+
+
+def _rasterize_view(ax: plt.Axes, geoms: np.ndarray, facecolors: np.ndarray, aspect: float) -> None:
+    """
+    Rasterize filled geometries with datashader and show the result as an image.
+
+    Every pixel takes the color of the last geometry covering it, which matches the
+    drawing order of the matplotlib backend; uncovered pixels stay transparent.
+
+    Parameters
+    ----------
+    ax : Axes
+        Axes to draw the image on; its size in pixels sets the raster resolution.
+    geoms : array-like of geometries
+        Polygons or MultiPolygons to rasterize.
+    facecolors : ndarray
+        One RGBA row per geometry.
+    aspect : float
+        Aspect ratio the axes will be drawn with, so raster pixels come out square.
+    """
+    try:
+        import datashader as ds
+    except ImportError as err:
+        raise ImportError("backend='datashader' requires the optional 'datashader' package") from err
+
+    if not len(geoms):
+        return
+    x0, y0, x1, y1 = shapely.total_bounds(geoms)
+    width = max(int(ax.bbox.width), 1)
+    height = max(int(width * aspect * (y1 - y0) / (x1 - x0)), 1) if x1 > x0 else max(int(ax.bbox.height), 1)
+    canvas = ds.Canvas(plot_width=width, plot_height=height, x_range=(x0, x1), y_range=(y0, y1))
+
+    frame = gpd.GeoDataFrame({'row': np.arange(len(geoms), dtype=float)}, geometry=gpd.array.from_shapely(geoms))
+    rows = canvas.polygons(frame, geometry='geometry', agg=ds.max('row')).to_numpy()
+    covered = ~np.isnan(rows)
+    image = np.zeros((*rows.shape, 4))
+    image[covered] = facecolors[rows[covered].astype(np.intp)]
+    raster = ax.imshow(image, origin='lower', extent=(x0, x1, y0, y1), interpolation='nearest')
+    # Keep the default axes margins so views frame the same as with vector paths
+    raster.sticky_edges.x.clear()  # type: ignore[union-attr]
+    raster.sticky_edges.y.clear()  # type: ignore[union-attr]
 
 
 def _plot_views(
     gdf: gpd.GeoDataFrame,
+    groups: dict[tuple[str, str], np.ndarray],
     views: list[dict],
-    column: str,
+    values: np.ndarray | None,
     cmap: mcolors.Colormap,
-    mask_region: str | None,
+    norm: mcolors.Normalize | None,
+    colors: np.ndarray | None,
+    mask_by_side: dict[str, gpd.GeoDataFrame],
     edgecolor: str,
     linewidth: float,
     aspect: float,
     axes: np.ndarray,
-    norm: mcolors.Normalize | None,
-    color_map: dict | None,
+    backend: str = 'matplotlib',
 ) -> None:
     """
     Render a list of atlas views onto provided axes.
@@ -117,15 +268,21 @@ def _plot_views(
     Parameters
     ----------
     gdf : GeoDataFrame
-        Input geospatial data with 'side', 'hemi', and specified column.
+        Input geospatial data with 'side' and 'hemi' columns.
+    groups : dict
+        Mapping from (side, hemi) to the positional row indices of that group in `gdf`.
     views : list of dict
         Each dict must have 'side' and 'hemi' keys for filtering.
-    column : str
-        Column name to color by.
+    values : ndarray or None
+        Per-row numeric values of `gdf`, mapped to colors through `cmap` and `norm`.
     cmap : Colormap
-        Colormap for numeric plots or used to generate category colors.
-    mask_region : str or None
-        Region label to draw as gray mask on top of plots.
+        Colormap for numeric values.
+    norm : Normalize or None
+        Shared normalization for numeric values.
+    colors : ndarray or None
+        Per-row RGBA face colors of `gdf` for categorical data.
+    mask_by_side : dict
+        Mapping from 'side' to the mask region rows drawn in gray on top of plots.
     edgecolor : str
         Color for polygon edges.
     linewidth : float
@@ -134,32 +291,39 @@ def _plot_views(
         Aspect ratio for each subplot.
     axes : array-like of Axes
         Axes objects corresponding to each view in 'views'.
-    norm : Normalize or None
-        Shared normalization for numeric data.
-    color_map : dict or None
-        Shared mapping from category to color.
+    backend : {'matplotlib', 'datashader'}
+        Draw filled regions as vector paths or as one datashader raster per view.
     """
+    empty = np.array([], dtype=np.intp)
+    geoms = gdf.geometry.values
+    # Convert all geometries to paths once; views only pick their rows
+    paths = _geometry_paths(geoms)
     for ax, view in zip(np.ravel(axes), views):
-        sel = gdf[gdf['side'] == view['side']]
-        hemi = view['hemi']
-        sel = sel[sel['hemi'].isin(hemi)] if isinstance(hemi, list | tuple) else sel[sel['hemi'] == hemi]
-        if norm is not None:
-            sel.plot(
-                column=column,
-                cmap=cmap,
-                norm=norm,
-                edgecolor=edgecolor,
-                linewidth=linewidth,
-                aspect=aspect,
-                legend=False,
-                ax=ax,
+        hemis = view['hemi'] if isinstance(view['hemi'], list | tuple) else [view['hemi']]
+        idx = np.sort(np.concatenate([groups.get((view['side'], hemi), empty) for hemi in hemis]))
+        view_paths = [paths[i] for i in idx]
+        if backend == 'datashader':
+            if values is not None:
+                facecolors = cm.ScalarMappable(norm=norm, cmap=cmap).to_rgba(values[idx])
+            else:
+                facecolors = colors[idx]  # type: ignore[index]
+            _rasterize_view(ax, geoms[idx], facecolors, aspect)
+            # Only the outlines are left to matplotlib
+            ax.add_collection(_view_to_collection(view_paths, 'none', edgecolor, linewidth))
+        else:
+            collection = _view_to_collection(view_paths, None if colors is None else colors[idx], edgecolor, linewidth)
+            if values is not None:
+                collection.set_array(values[idx])
+                collection.set_cmap(cmap)
+                collection.set_norm(norm)
+            ax.add_collection(collection)
+        mask = mask_by_side.get(view['side'])
+        if mask is not None and len(mask):
+            ax.add_collection(
+                _view_to_collection(_geometry_paths(mask.geometry.values), '#A1A1A1', edgecolor, linewidth)
             )
-        elif color_map is not None:
-            sel_colors = sel[column].map(color_map)
-            sel.plot(color=sel_colors, edgecolor=edgecolor, linewidth=linewidth, aspect=aspect, ax=ax)
-        if mask_region:
-            mask = gdf[(gdf['side'] == view['side']) & (gdf.get('region') == mask_region)]
-            mask.plot(color='#A1A1A1', edgecolor=edgecolor, linewidth=linewidth, aspect=aspect, ax=ax)
+        ax.autoscale_view()
+        ax.set_aspect(aspect)
         ax.set_axis_off()
 
 
@@ -177,6 +341,9 @@ def _plot_multi(
     vmin: float | None,
     vmax: float | None,
     show_cbar: bool,
+    fig: plt.Figure | None = None,
+    axes: Any = None,
+    backend: str = 'matplotlib',
 ) -> tuple[plt.Figure, np.ndarray]:
     """
     Generic multi-panel plotting framework for atlas views.
@@ -209,6 +376,14 @@ def _plot_multi(
         Maximum data value for normalization.
     show_cbar : bool
         If True, display colorbar or legend.
+    fig : Figure, optional
+        Figure to draw into; new axes are added to it if `axes` is None. Defaults to
+        the figure of `axes`, or a new figure of size `figsize`.
+    axes : Axes or array of Axes, optional
+        Existing axes with one entry per view. They are cleared first, and a colorbar or
+        legend from an earlier plot into the same axes is replaced.
+    backend : {'matplotlib', 'datashader'}, default 'matplotlib'
+        Rendering backend for filled regions.
 
     Returns
     -------
@@ -217,12 +392,51 @@ def _plot_multi(
     axes : array-like
         Array of Axes objects corresponding to each view.
     """
+    if backend not in ('matplotlib', 'datashader'):
+        raise ValueError(f"Unknown backend '{backend}'. Expected 'matplotlib' or 'datashader'.")
     is_num, norm, color_map, cmap = _prepare_coloring(gdf[column], cmap, vmin, vmax)
-    fig, axes = plt.subplots(layout[0], layout[1], figsize=figsize, squeeze=False)
-    _plot_views(gdf, views, column, cmap, mask_region, edgecolor, linewidth, aspect, axes, norm, color_map)
+
+    # Split rows by (side, hemi) once instead of rescanning both columns per view
+    groups = gdf.groupby(['side', 'hemi'], sort=False, observed=True).indices
+
+    # The mask does not depend on the view, so split it by side once.
+    # Polygons are not dissolved: atlas geometries are not guaranteed to be valid,
+    # and merged parts would be filled as one compound path.
+    mask_by_side: dict[str, gpd.GeoDataFrame] = {}
+    if mask_region and 'region' in gdf:
+        mask = gdf.loc[gdf['region'] == mask_region, ['side', 'geometry']]
+        mask_by_side = dict(iter(mask.groupby('side', sort=False, observed=True)))
+
+    # Numeric values are colormapped by matplotlib and missing ones are not drawn;
+    # categories are resolved to per-row colors once, unknown values are transparent.
+    values = colors = None
+    if norm is not None:
+        values = gdf[column].to_numpy(dtype=float, na_value=np.nan)
+        groups = {key: idx[~np.isnan(values[idx])] for key, idx in groups.items()}
+    else:
+        codes = pd.Categorical(gdf[column], categories=list(color_map)).codes
+        colors = np.array([*color_map.values(), (0.0, 0.0, 0.0, 0.0)])[codes]
+
+    reuse = axes is not None
+    if axes is None:
+        if fig is None:
+            fig, axes = plt.subplots(layout[0], layout[1], figsize=figsize, squeeze=False)
+        else:
+            axes = fig.subplots(layout[0], layout[1], squeeze=False)
+    else:
+        axes = np.asarray(axes, dtype=object).reshape(layout)
+        fig = fig if fig is not None else axes.flat[0].figure
+        _reset_axes(fig, axes)
+    _plot_views(
+        gdf, groups, views, values, cmap, norm, colors, mask_by_side, edgecolor, linewidth, aspect, axes, backend
+    )
     if show_cbar:
-        gdf[column]
-        _add_colorbar(fig, axes, column, cmap, norm=norm, color_map=color_map)
+        positions = [(ax, ax.get_position(original=True)) for ax in axes.flat]
+        decoration = _add_colorbar(fig, axes, column, cmap, norm=norm, color_map=color_map)
+        if reuse and decoration is not None:
+            # tag the artist that shows up in fig.axes or fig.legends
+            tagged = decoration if decoration in fig.legends else decoration.ax
+            setattr(tagged, _REUSE_TAG, (decoration, positions))
     return fig, axes
 
 
@@ -234,6 +448,8 @@ def plot_aseg(
     vmin: float | None = None,
     vmax: float | None = None,
     show_cbar: bool = True,
+    fig: plt.Figure | None = None,
+    axes: np.ndarray | None = None,
 ) -> tuple[plt.Figure, np.ndarray]:
     """
     Plot ASEG volumetric segmentation in coronal and sagittal views.
@@ -254,6 +470,12 @@ def plot_aseg(
         Upper bound for colormap normalization.
     show_cbar : bool, default True
         If True, display a colorbar (numeric) or legend (categorical).
+    fig : Figure, optional
+        Figure to draw into; new axes are added to it if `axes` is None.
+    axes : array of Axes, optional
+        Two existing Axes (coronal, sagittal) to draw into instead of creating a new
+        figure. They are cleared first, and the colorbar or legend of an earlier plot
+        into the same axes is replaced, so the axes can be reused in a loop.
 
     Returns
     -------
@@ -263,7 +485,9 @@ def plot_aseg(
         Axes for the respective views: [0]=coronal, [1]=sagittal.
     """
     views = [{'side': 'coronal', 'hemi': ['left', 'right']}, {'side': 'sagittal', 'hemi': 'midline'}]
-    return _plot_multi(gdf, views, (1, 2), value, cmap, mask_region, 'black', 1.0, 1, (10, 5), vmin, vmax, show_cbar)
+    return _plot_multi(
+        gdf, views, (1, 2), value, cmap, mask_region, 'black', 1.0, 1, (10, 5), vmin, vmax, show_cbar, fig, axes
+    )
 
 
 def plot_surface(
@@ -277,6 +501,9 @@ def plot_surface(
     vmin: float | None = None,
     vmax: float | None = None,
     show_cbar: bool = False,
+    fig: plt.Figure | None = None,
+    axes: np.ndarray | None = None,
+    backend: str = 'matplotlib',
 ) -> tuple[plt.Figure, np.ndarray]:
     """
     Plot surface atlas in lateral and medial views for both hemispheres.
@@ -303,6 +530,17 @@ def plot_surface(
         Upper bound for numeric colormap.
     show_cbar : bool, default False
         If True, display a colorbar or legend.
+    fig : Figure, optional
+        Figure to draw into; new axes are added to it if `axes` is None.
+    axes : array of Axes, optional
+        Four existing Axes (lateral L/R, medial L/R) to draw into instead of creating a
+        new figure. They are cleared first, and the colorbar or legend of an earlier
+        plot into the same axes is replaced, so the axes can be reused in a loop.
+    backend : {'matplotlib', 'datashader'}, default 'matplotlib'
+        'datashader' is an optional rasterized alternative: the filled regions of each
+        view are rendered to an image with datashader (optional dependency) and only
+        the outlines are drawn as vectors. It is not faster than 'matplotlib' for the
+        bundled atlases, and its first call compiles numba kernels, which takes seconds.
 
     Returns
     -------
@@ -318,7 +556,22 @@ def plot_surface(
         {'side': 'medial', 'hemi': 'right'},
     ]
     return _plot_multi(
-        gdf, views, (2, 2), column, cmap, None, edgecolor, linewidth, aspect, figsize, vmin, vmax, show_cbar
+        gdf,
+        views,
+        (2, 2),
+        column,
+        cmap,
+        None,
+        edgecolor,
+        linewidth,
+        aspect,
+        figsize,
+        vmin,
+        vmax,
+        show_cbar,
+        fig,
+        axes,
+        backend,
     )
 
 
@@ -335,6 +588,7 @@ def plot_view(
     vmin: float | None = None,
     vmax: float | None = None,
     show_cbar: bool = False,
+    axes: plt.Axes | None = None,
 ) -> tuple[plt.Figure, plt.Axes]:
     """
     Plot a single hemisphere/side view of an atlas.
@@ -365,6 +619,10 @@ def plot_view(
         Upper bound for numeric colormap.
     show_cbar : bool
         If True, display a colorbar or legend.
+    axes : Axes, optional
+        Existing Axes to draw into instead of creating a new figure. It is cleared first,
+        and the colorbar or legend of an earlier plot into it is replaced, so the axes
+        can be reused in a loop.
 
     Returns
     -------
@@ -374,7 +632,7 @@ def plot_view(
         Matplotlib Axes for the request view.
     """
     views = [{'side': side, 'hemi': hemi}]
-    fig, axes = _plot_multi(
-        gdf, views, (1, 1), column, cmap, None, edgecolor, linewidth, aspect, figsize, vmin, vmax, show_cbar
+    fig, grid = _plot_multi(
+        gdf, views, (1, 1), column, cmap, None, edgecolor, linewidth, aspect, figsize, vmin, vmax, show_cbar, axes=axes
     )
-    return fig, axes[0, 0]
+    return fig, grid[0, 0]
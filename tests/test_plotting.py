@@ -3,48 +3,180 @@ from ggseg_py.ggseg_py import rda2gpd, merge_data
 from ggseg_py.plotting_utils import plot_surface, plot_view, plot_aseg
 from ggseg_py.conversion_dicts import aseg_dict
 from pathlib import Path
+import gc
+import os
+import shutil
+import stat
+import warnings
+import weakref
 import numpy as np
+import shapely
 import pandas as pd
+import pytest
+import matplotlib
+matplotlib.use("Agg")  # non-interactive backend, no GUI setup on CI
+import matplotlib.pyplot as plt
 
-def test_glasser():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "glasser.rda"
-    gdf = rda2gpd(atlas_path, 'glasser')
-    plot_surface(gdf)
-
-def test_aseg():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "aseg.rda"
-    gdf = rda2gpd(atlas_path, 'aseg')
-    plot_aseg(gdf)
-
-def test_data_merge():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "aseg.rda"
-    test_df = (pd.DataFrame(dict(zip(aseg_dict.values(), 
-                                     np.arange(len(aseg_dict.values())))), index=[0])
-                 .melt(var_name='StructName', value_name='value'))
-    gdf = rda2gpd(atlas_path, 'aseg')
-    gdf = merge_data(test_df, geo_df=gdf, atlas_name='aseg')
+ATLAS_DIR = Path(__file__).resolve().parent.parent / "ggseg_py" / "atlases"
+GLASSER = ATLAS_DIR / "glasser.rda"
+ASEG = ATLAS_DIR / "aseg.rda"
+DK = ATLAS_DIR / "dk.rda"
+
+def load_atlas(atlas_path, name):
+    # always parse: a cache in the package directory would skip the parsing code under test;
+    # the fixtures are session scoped, so each atlas is still parsed only once
+    gdf = rda2gpd(atlas_path, name, use_cache=False)
+    # atlases use very different coordinate ranges, so scale the tolerance to the extent
+    _, miny, _, maxy = gdf.total_bounds
+    gdf['geometry'] = gdf.geometry.simplify(1e-3 * (maxy - miny), preserve_topology=True)
+    # drop the smallest 5% of islands (always keeping each region's largest part) and
+    # regroup the rest per row; dissolve would union the invalid atlas polygons
+    parts = gdf.geometry.explode(index_parts=False)
+    area = parts.area
+    parts = parts[(area > area.quantile(0.05)) | (area == area.groupby(level=0).transform('max'))]
+    gdf['geometry'] = shapely.multipolygons(np.asarray(parts.values), indices=gdf.index.get_indexer(parts.index))
+    # only keep what plotting and merge_data read
+    keep = ['geometry', 'region', 'hemi', 'side', 'label', 'roi']
+    return gdf[[col for col in keep if col in gdf.columns]]
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    # pyplot keeps every figure alive until it is closed
+    yield
+    plt.close('all')
+
+@pytest.fixture(scope="session")
+def glasser_gdf():
+    return load_atlas(GLASSER, 'glasser')
+
+@pytest.fixture(scope="session")
+def aseg_gdf():
+    return load_atlas(ASEG, 'aseg')
+
+@pytest.fixture(scope="session")
+def dk_gdf():
+    return load_atlas(DK, 'dk')
+
+def test_glasser(glasser_gdf):
+    plot_surface(glasser_gdf)
+
+def test_aseg(aseg_gdf):
+    plot_aseg(aseg_gdf)
+
+def test_data_merge(aseg_gdf):
+    names = tuple(aseg_dict.values())
+    test_df = pd.DataFrame({'StructName': pd.array(names, dtype='string'),
+                            'value': np.arange(len(names), dtype=np.int32)})
+    gdf = merge_data(test_df, geo_df=aseg_gdf, atlas_name='aseg')
+    assert gdf['roi'].dtype == aseg_gdf['roi'].dtype
     
     plot_aseg(gdf, 'value')
 
-def test_dk():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "dk.rda"
-    gdf = rda2gpd(atlas_path, 'dk')
-    plot_surface(gdf)
-
-def test_val_plotting():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "dk.rda"
-    gdf = rda2gpd(atlas_path, 'dk')
-    gdf['data2plot'] = np.arange(len(gdf))
-    plot_surface(gdf, column='data2plot', cmap='Reds', show_cbar=True)
-
-def test_view_dk():
-    HERE = Path(__file__).parent.parent  
-    atlas_path = HERE / "ggseg_py" / "atlases" / "dk.rda"
-    gdf = rda2gpd(atlas_path, 'dk')
-    plot_view(gdf, side='medial', hemi='right')
+def test_merge_data_validation(aseg_gdf):
+    # names without a conversion entry are used as roi directly
+    rois = aseg_gdf['roi'].drop_duplicates().to_numpy()
+    test_df = pd.DataFrame({'StructName': rois, 'value': np.arange(len(rois), dtype=np.int32)})
+    gdf = merge_data(test_df, geo_df=aseg_gdf, atlas_name='aseg')
+    assert len(gdf) == len(aseg_gdf)
+    assert gdf['value'].notna().all()
+    # empty data merges without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert len(merge_data(test_df.iloc[:0], geo_df=aseg_gdf, atlas_name='aseg')) == len(aseg_gdf)
+    # a duplicated structure is ambiguous
+    with pytest.raises(pd.errors.MergeError):
+        merge_data(pd.concat([test_df, test_df.iloc[:1]]), geo_df=aseg_gdf, atlas_name='aseg')
+
+def test_dk(dk_gdf):
+    plot_surface(dk_gdf)
+
+def test_val_plotting(dk_gdf):
+    gdf = dk_gdf.assign(data2plot=np.arange(len(dk_gdf), dtype=np.int32))
+    plot_surface(gdf, column='data2plot', cmap='Reds', show_cbar=True, vmin=0, vmax=len(gdf) - 1)
+
+    # a column without any values plots without numpy warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        plot_surface(gdf.assign(data2plot=np.nan), column='data2plot')
+
+def test_view_dk(dk_gdf):
+    plot_view(dk_gdf, side='medial', hemi='right')
+
+@pytest.mark.parametrize("atlas_path, name", [(DK, 'dk'), (ASEG, 'aseg')])
+def test_atlas_cache(tmp_path, atlas_path, name):
+    pytest.importorskip('pyarrow')
+    atlas_path = shutil.copy(atlas_path, tmp_path / atlas_path.name)
+    umask = os.umask(0)
+    os.umask(umask)
+    gdf = rda2gpd(atlas_path, name)
+    (cache_path,) = tmp_path.glob(f'{name}.{name}.*.parquet')
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o666 & ~umask
+    cached = rda2gpd(atlas_path, name)
+    pd.testing.assert_frame_equal(cached.drop(columns='geometry'), gdf.drop(columns='geometry'))
+    assert cached.geom_equals_exact(gdf, tolerance=0).all()
+
+    # an unreadable cache falls back to parsing the .rda file
+    cache_path.write_bytes(b'not a parquet file')
+    reparsed = rda2gpd(atlas_path, name)
+    pd.testing.assert_frame_equal(reparsed.drop(columns='geometry'), gdf.drop(columns='geometry'))
+
+def test_reuse_axes(dk_gdf):
+    gdf = dk_gdf
+    fig, axes = plt.subplots(2, 2)
+    out_fig, out_axes = plot_surface(gdf, axes=axes)
+    assert out_fig is fig
+    assert all(len(ax.collections) == 1 for ax in np.ravel(out_axes))
+    _, ax = plot_view(gdf, side='medial', hemi='right', axes=axes[0, 0])
+    assert ax is axes[0, 0]
+
+    # reusing the axes in a loop replaces the previous colorbar or legend
+    gdf = gdf.assign(data2plot=np.arange(len(gdf), dtype=np.int32))
+    positions = [ax.get_position(original=True).bounds for ax in axes.flat]
+    for column in ['data2plot', 'data2plot', 'label', 'data2plot']:
+        plot_surface(gdf, column=column, show_cbar=True, axes=axes)
+    assert len(fig.axes) == 5 and not fig.legends
+    assert all(len(ax.collections) == 1 for ax in axes.flat)
+    plot_surface(gdf, show_cbar=False, axes=axes)
+    assert len(fig.axes) == 4
+    assert [ax.get_position(original=True).bounds for ax in axes.flat] == positions
+
+    # reusing a single panel removes the colorbar of the whole grid and restores every panel
+    plot_surface(gdf, column='data2plot', show_cbar=True, axes=axes)
+    plot_view(gdf, side='medial', hemi='right', axes=axes[0, 0])
+    assert len(fig.axes) == 4
+    assert [ax.get_position(original=True).bounds for ax in axes.flat] == positions
+
+    # a given figure is drawn into when no axes are passed
+    fig = plt.figure()
+    out_fig, _ = plot_surface(gdf, fig=fig)
+    assert out_fig is fig and len(fig.axes) == 4
+
+
+def test_closed_figures_are_released(dk_gdf):
+    gdf = dk_gdf.assign(data2plot=np.arange(len(dk_gdf), dtype=np.int32))
+
+    def plot_and_close():
+        new_fig, _ = plot_surface(gdf, column='data2plot', show_cbar=True)
+        reused_fig, _ = plot_surface(gdf, column='data2plot', show_cbar=True, axes=plt.subplots(2, 2)[1])
+        plt.close('all')
+        return weakref.ref(new_fig), weakref.ref(reused_fig)
+
+    refs = plot_and_close()
+    gc.collect()
+    assert all(ref() is None for ref in refs)
+
 
+def test_datashader_backend(dk_gdf):
+    pytest.importorskip('datashader')
+    fig, axes = plot_surface(dk_gdf, backend='datashader')
+    assert all(len(ax.images) == 1 for ax in np.ravel(axes))
+    gdf = dk_gdf.assign(data2plot=np.arange(len(dk_gdf), dtype=float))
+    plot_surface(gdf, column='data2plot', cmap='viridis', show_cbar=True, backend='datashader')
+    # raster pixels stay square when the axes are stretched
+    _, axes = plot_surface(dk_gdf, aspect=2, backend='datashader')
+    image = axes[0, 0].images[0]
+    x0, x1, y0, y1 = image.get_extent()
+    height, width = image.get_array().shape[:2]
+    assert height / width == pytest.approx(2 * (y1 - y0) / (x1 - x0), rel=0.02)
+    with pytest.raises(ValueError):
+        plot_surface(dk_gdf, backend='plotly')